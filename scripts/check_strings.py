@@ -1,12 +1,16 @@
 #!/usr/bin/python3
 
 import argparse
+import concurrent.futures
 import configparser
+import functools
+import html
 import os
 import json
+import orjson
+import pickle
 import re
 import sys
-from html.parser import HTMLParser
 from hunspell import Hunspell
 import nltk
 import string
@@ -20,47 +24,287 @@ except ImportError as e:
     sys.exit(1)
 
 
-class MLStripper(HTMLParser):
-    def __init__(self):
-        super().__init__()
-        self.reset()
-        self.strict = False
-        self.convert_charrefs = True
-        self.fed = []
+# orjson always emits UTF-8, matching the previous ensure_ascii=False
+JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+
+HTML_TAGS = re.compile(r"<[^>]+>")
+
+# Tokenizer, replacing nltk.word_tokenize and its Punkt + Treebank
+# machinery. Like Treebank, it needs to keep intra-word punctuation
+# together (built-in, manifest.json, Maiusc+F11, columns:2), accept a
+# leading dot/colon/hyphen (.png, :first-line, -moz-element) and keep
+# escaped Unicode literals like \u0020 whole; anything else is a word
+# run or a single non-space character. Tuned against the tokens in
+# exceptions/spelling.json, so curated exceptions keep matching.
+TOKENS = re.compile(
+    r"\\u[0-9A-Fa-f]{4}(?:-\\u[0-9A-Fa-f]{4})*"
+    r"|[.:-]?\w+(?:[-.+:]\w+)*"
+    r"|[^\w\s]",
+    re.UNICODE,
+)
+
+STRAIGHT_QUOTES = re.compile(r'\'|"|‘')
+
+# Single-character cleanup replacements, applied in one translate() pass
+CLEANUP_TABLE = str.maketrans({"…": "", "/": " "})
+
+# Cleanup replacements with multi-character output (literal \n becomes a
+# space, = gets surrounded by spaces), applied in one regex pass
+CLEANUP_MULTI = re.compile(r"\\n|=")
+
+# Fluent syntax that requires double quotes, ignored when checking quotes
+FTL_FUNCTIONS = [
+    # Parameterized terms
+    re.compile(
+        r'(?<!\{)\{\s*(?:-[A-Za-z0-9._-]+)(?:[\[(]?[A-Za-z0-9_\-, :"]+[\])])*\s*\}'
+    ),
+    # DATETIME() and NUMBER() function
+    re.compile(r"{\s*(?:DATETIME|NUMBER)(.*)\s*}"),
+    # Special characters and empty string
+    re.compile(r'{\s*"(?:[\s{}]{0,1})"\s*}'),
+]
+
+# Placeables to remove before spellchecking, by file extension
+PLACEABLES = {
+    ".ftl": [
+        # Message references, variables, terms
+        re.compile(
+            r'(?<!\{)\{\s*([\$|-]?[A-Za-z0-9._-]+)(?:[\[(]?[A-Za-z0-9_\-, :"]+[\])])*\s*\}'
+        ),
+        # DATETIME()
+        re.compile(r"\{\s*DATETIME\(.*\)\s*\}"),
+        # Variants syntax
+        re.compile(r"\{?\s*\$[a-zA-Z]+\s*->"),
+        # Variants names
+        re.compile(r"^\s*\*?\[[a-zA-Z0-9_-]*\]"),
+    ],
+    ".properties": [
+        # printf
+        re.compile(r"(%(?:[0-9]+\$){0,1}(?:[0-9].){0,1}([sS]))"),
+        # webl10n in pdf.js
+        re.compile(
+            r"\{\[\s?plural\([a-zA-Z]+\)\s?\]\}|\{{1,2}\s?[a-zA-Z_-]+\s?\}{1,2}"
+        ),
+    ],
+    ".dtd": [
+        re.compile(r"&([A-Za-z0-9\.]+);"),
+    ],
+    ".ini": [
+        re.compile(r"%[A-Z_-]+%"),
+    ],
+}
+
+# Fuse the patterns of each extension into a single alternation, so that
+# every message is scanned once instead of once per pattern. MULTILINE is
+# needed because the variant names pattern is anchored to the line start.
+PLACEABLES_FUSED = {
+    extension: re.compile("|".join(f"(?:{p.pattern})" for p in patterns), re.MULTILINE)
+    for extension, patterns in PLACEABLES.items()
+}
+
+# Per-process state for spellcheck workers, set up in initSpellingWorker
+WORKER = {}
+
+
+def initSpellingWorker(dictionary_path):
+    """Set up spellcheck data once per worker process"""
+
+    # Load hunspell dictionaries
+    spellchecker = Hunspell("it_IT", hunspell_data_dir=f"{dictionary_path}")
+    spellchecker.add_dic(os.path.join(dictionary_path, "mozilla_qa_specialized.dic"))
+
+    # Cache spellcheck results, since the same words and word groups are
+    # checked over and over, and each check crosses into the Hunspell
+    # library
+    WORKER["spell"] = functools.lru_cache(maxsize=100_000)(spellchecker.spell)
+
+    # Punctuation and Italian stopwords, as frozensets for O(1) lookups
+    WORKER["punctuation"] = frozenset(string.punctuation)
+    WORKER["stop_words"] = frozenset(nltk.corpus.stopwords.words("italian"))
+
+
+def spell(text):
+    """Check spelling, caching results to avoid repeated Hunspell calls"""
+
+    return WORKER["spell"](text)
+
+
+def strip_tags(text):
+    """Remove HTML tags and convert character references"""
+
+    # The vast majority of messages contain no markup at all
+    if "<" in text:
+        text = HTML_TAGS.sub(" ", text)
+    if "&" in text:
+        text = html.unescape(text)
+
+    return text
+
+
+def excludeToken(token):
+    """Exclude specific tokens after spellcheck"""
+
+    # Ignore acronyms (all uppercase) and token made up only by
+    # unicode characters, or punctuation
+    if token == token.upper():
+        return True
+
+    # Ignore domains in strings
+    if any(k in token for k in ["example.com", "mozilla.org"]):
+        return True
+
+    # Ignore DevTools accesskeys
+    if any(k in token for k in ["Alt+", "Cmd+", "Ctrl+"]):
+        return True
+
+    return False
+
+
+def parseFile(file_path, repository_path):
+    """Parse a single localization file (runs in a worker process)
+
+    Returns the extracted strings and whether parsing succeeded."""
+
+    file_extension = os.path.splitext(file_path)[1]
+    file_name = file_path[len(repository_path) + 1 :]
+
+    strings = {}
+    file_parser = parser.getParser(file_extension)
+    file_parser.readFile(file_path)
+    try:
+        entities = file_parser.parse()
+        for entity in entities:
+            # Ignore Junk
+            if isinstance(entity, parser.Junk):
+                continue
+
+            string_id = f"{file_name}:{entity}"
+            if file_extension == ".ftl":
+                if entity.raw_val != "":
+                    strings[string_id] = entity.raw_val
+                # Store attributes
+                for attribute in entity.attributes:
+                    attr_string_id = f"{file_name}:{entity}.{attribute}"
+                    strings[attr_string_id] = attribute.raw_val
+            else:
+                strings[string_id] = entity.raw_val
+    except Exception as e:
+        print(f"Error parsing file: {file_path}")
+        print(e)
+        return strings, False
+
+    return strings, True
+
+
+def spellcheckMessage(message, extension):
+    """Clean up and spellcheck a single message (runs in a worker process)"""
+
+    # Strip HTML
+    cleaned_message = strip_tags(message)
+
+    # Remove ellipsis and newlines, and replace other characters to
+    # reduce errors
+    cleaned_message = cleaned_message.translate(CLEANUP_TABLE)
+    cleaned_message = CLEANUP_MULTI.sub(
+        lambda m: " " if m.group() == r"\n" else " = ", cleaned_message
+    )
+
+    # Remove placeables from FTL and properties strings
+    if extension in PLACEABLES_FUSED:
+        cleaned_message = PLACEABLES_FUSED[extension].sub(" ", cleaned_message)
+
+    # Tokenize sentence
+    tokens = TOKENS.findall(cleaned_message)
+
+    """
+        Classify all tokens upfront, keeping the full sentence intact:
+        the loop below still needs to access neighbor tokens by index.
+        The comprehensions run in a single C-level pass each, so the hot
+        loop only reads precomputed flags.
+    """
+    is_punct = [t in WORKER["punctuation"] for t in tokens]
+    is_stop = [t.lower() in WORKER["stop_words"] for t in tokens]
+
+    errors = []
+    for i, token in enumerate(tokens):
+        if is_punct[i]:
+            continue
+
+        if is_stop[i]:
+            continue
+
+        # Fast path: don't waste a Hunspell call on tokens not worth
+        # reporting. Numbers would be discarded by excludeToken as
+        # all-uppercase tokens anyway, and stray single letters are
+        # noise rather than actionable spelling errors.
+        if token.isdigit() or len(token) == 1:
+            continue
+
+        if not spell(token):
+            # It's misspelled, but I still need to remove a few outliers
+            if excludeToken(token):
+                continue
+
+            """
+              Check if the next token is an apostrophe. If it is,
+              check spelling together with the two next tokens.
+              This allows to ignore things like "cos’altro".
+            """
+            if (
+                i + 3 <= len(tokens)
+                and tokens[i + 1] == "’"
+                and tokens[i + 2][:1].isalpha()
+            ):
+                group = "".join(tokens[i : i + 3])
+                if spell(group):
+                    continue
+
+            """
+              It might be a brand with two words, e.g. Common Voice.
+              Need to look in both direction. The group can only be a
+              word if the neighbor starts with a letter, skip the
+              Hunspell call otherwise.
+            """
+            if i + 2 <= len(tokens) and tokens[i + 1][:1].isalpha():
+                group = " ".join(tokens[i : i + 2])
+                if spell(group):
+                    continue
+            if i >= 1 and tokens[i - 1][:1].isalpha():
+                group = " ".join(tokens[i - 1 : i + 1])
+                if spell(group):
+                    continue
 
-    def handle_data(self, d):
-        self.fed.append(d)
+            errors.append(token)
 
-    def get_data(self):
-        return " ".join(self.fed)
+    return cleaned_message, tokens, errors
 
 
 class CheckStrings:
     def __init__(self, script_path, repository_path, verbose):
         """Initialize object"""
 
-        # Set defaults
-        self.supported_formats = [
+        # Set defaults. Formats are a tuple so str.endswith can check
+        # them all in a single call.
+        self.supported_formats = (
             ".dtd",
             ".ftl",
             ".inc",
             ".ini",
             ".properties",
-        ]
+        )
         self.file_list = []
         self.verbose = verbose
         self.strings = {}
+        self.content_ids = {}
         self.script_path = script_path
         self.exceptions_path = os.path.join(script_path, os.path.pardir, "exceptions")
         self.errors_path = os.path.join(script_path, os.path.pardir, "errors")
         self.repository_path = repository_path.rstrip(os.path.sep)
 
-        # Set up spellcheckers
-        # Load hunspell dictionaries
-        dictionary_path = os.path.join(self.script_path, os.path.pardir, "dictionaries")
-        self.spellchecker = Hunspell("it_IT", hunspell_data_dir=f"{dictionary_path}")
-        self.spellchecker.add_dic(
-            os.path.join(dictionary_path, "mozilla_qa_specialized.dic")
+        # Hunspell dictionaries are loaded in each spellcheck worker
+        # process, see initSpellingWorker
+        self.dictionary_path = os.path.join(
+            self.script_path, os.path.pardir, "dictionaries"
         )
 
         # Extract strings
@@ -77,35 +321,79 @@ class CheckStrings:
         # Create a list of files to analyze
         self.extractFileList()
 
-        for file_path in self.file_list:
-            file_extension = os.path.splitext(file_path)[1]
-            file_name = self.getRelativePath(file_path)
+        file_paths = [
+            f
+            for f in self.file_list
+            if not self.getRelativePath(f).endswith("region.properties")
+        ]
 
-            if file_name.endswith("region.properties"):
-                continue
+        # Load the cache of previously parsed files. Entries are keyed by
+        # path and store mtime and size, so only new or changed files need
+        # to be parsed again.
+        cache_file = os.path.join(
+            os.path.expanduser("~"), ".cache", "gecko-it-qa", "strings.pkl"
+        )
+        cache = {}
+        try:
+            with open(cache_file, "rb") as f:
+                cache = pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError):
+            pass
+
+        file_stats = {f: os.stat(f) for f in file_paths}
+        files_to_parse = [
+            f
+            for f in file_paths
+            if f not in cache
+            or cache[f][0] != (file_stats[f].st_mtime, file_stats[f].st_size)
+        ]
 
-            file_parser = parser.getParser(file_extension)
-            file_parser.readFile(file_path)
-            try:
-                entities = file_parser.parse()
-                for entity in entities:
-                    # Ignore Junk
-                    if isinstance(entity, parser.Junk):
-                        continue
+        # Parsing is CPU-bound and independent per file, spread it over
+        # all available cores
+        parsed_files = {}
+        failed_files = set()
+        if files_to_parse:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=os.cpu_count()
+            ) as executor:
+                results = executor.map(
+                    functools.partial(parseFile, repository_path=self.repository_path),
+                    files_to_parse,
+                    chunksize=20,
+                )
+                for file_path, (file_strings, parsed_ok) in zip(
+                    files_to_parse, results
+                ):
+                    parsed_files[file_path] = file_strings
+                    if not parsed_ok:
+                        failed_files.add(file_path)
+
+        # Merge cached and freshly parsed strings in file order, and
+        # rebuild the cache so removed files drop out of it. Files that
+        # failed to parse are not cached, so they're parsed again (and
+        # the error printed again) on the next run.
+        new_cache = {}
+        for file_path in file_paths:
+            if file_path in parsed_files:
+                file_strings = parsed_files[file_path]
+            else:
+                file_strings = cache[file_path][1]
+            self.strings.update(file_strings)
+
+            if file_path not in failed_files:
+                new_cache[file_path] = (
+                    (file_stats[file_path].st_mtime, file_stats[file_path].st_size),
+                    file_strings,
+                )
 
-                    string_id = f"{file_name}:{entity}"
-                    if file_extension == ".ftl":
-                        if entity.raw_val != "":
-                            self.strings[string_id] = entity.raw_val
-                        # Store attributes
-                        for attribute in entity.attributes:
-                            attr_string_id = f"{file_name}:{entity}.{attribute}"
-                            self.strings[attr_string_id] = attribute.raw_val
-                    else:
-                        self.strings[string_id] = entity.raw_val
-            except Exception as e:
-                print(f"Error parsing file: {file_path}")
-                print(e)
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file, "wb") as f:
+            pickle.dump(new_cache, f)
+
+        # Group string IDs by content. The same message is often repeated
+        # across files, and checks only need to analyze it once.
+        for string_id, message in self.strings.items():
+            self.content_ids.setdefault(message, []).append(string_id)
 
     def extractFileList(self):
         """Extract the list of supported files"""
@@ -120,17 +408,22 @@ class CheckStrings:
             "suite",
         ]
 
-        for root, dirs, files in os.walk(self.repository_path, followlinks=True):
-            # Ignore excluded folders
-            if root == self.repository_path:
-                dirs[:] = [d for d in dirs if d not in excluded_folders]
-
-            for f in files:
-                for supported_format in self.supported_formats:
-                    if f.endswith(supported_format):
-                        self.file_list.append(os.path.join(root, f))
+        self.scanFolder(self.repository_path, excluded_folders)
         self.file_list.sort()
 
+    def scanFolder(self, path, excluded_folders=()):
+        """Recursively scan a folder for supported files"""
+
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=True):
+                    # Ignore excluded folders at the top level
+                    if entry.name in excluded_folders:
+                        continue
+                    self.scanFolder(entry.path)
+                elif entry.name.endswith(self.supported_formats):
+                    self.file_list.append(entry.path)
+
     def getRelativePath(self, file_name):
         """Get the relative path of a filename"""
 
@@ -138,12 +431,6 @@ class CheckStrings:
 
         return relative_path
 
-    def strip_tags(self, text):
-        html_stripper = MLStripper()
-        html_stripper.feed(text)
-
-        return html_stripper.get_data()
-
     def checkQuotes(self):
         """Check quotes"""
 
@@ -155,68 +442,43 @@ class CheckStrings:
         # Keep track of the exceptions used to clean up the file
         matched_exceptions = []
 
-        ftl_functions = [
-            # Parameterized terms
-            re.compile(
-                r'(?<!\{)\{\s*(?:-[A-Za-z0-9._-]+)(?:[\[(]?[A-Za-z0-9_\-, :"]+[\])])*\s*\}'
-            ),
-            # DATETIME() and NUMBER() function
-            re.compile(r"{\s*(?:DATETIME|NUMBER)(.*)\s*}"),
-            # Special characters and empty string
-            re.compile(r'{\s*"(?:[\s{}]{0,1})"\s*}'),
-        ]
-        straight_quotes = re.compile(r'\'|"|‘')
-
         all_errors = []
-        for message_id, message in self.strings.items():
-            if message_id in exceptions:
-                matched_exceptions.append(message_id)
+        for message, message_ids in self.content_ids.items():
+            # Exceptions are stored by string ID, filter them out first
+            remaining_ids = []
+            for message_id in message_ids:
+                if message_id in exceptions:
+                    matched_exceptions.append(message_id)
+                else:
+                    remaining_ids.append(message_id)
+            if not remaining_ids:
                 continue
-            if message and straight_quotes.findall(message):
+
+            if message and STRAIGHT_QUOTES.findall(message):
                 # Remove HTML tags
-                cleaned_msg = self.strip_tags(message)
+                cleaned_msg = strip_tags(message)
                 # Remove various Fluent syntax that requires double quotes
-                for f in ftl_functions:
+                for f in FTL_FUNCTIONS:
                     cleaned_msg = f.sub("", cleaned_msg)
 
                 # Continue if message is now clean
-                if not straight_quotes.findall(cleaned_msg):
+                if not STRAIGHT_QUOTES.findall(cleaned_msg):
                     continue
 
-                all_errors.append(message_id)
+                # The error applies to all strings sharing this content
+                all_errors.extend(remaining_ids)
                 if self.verbose:
-                    print(f"{message_id}: wrong quotes\n{message}")
-
-        with open(
-            os.path.join(self.errors_path, "quotes.json"), "w", encoding="utf8"
-        ) as f:
-            json.dump(all_errors, f, indent=2, sort_keys=True, ensure_ascii=False)
-
-        if matched_exceptions != exceptions:
-            with open(exceptions_filename, "w") as f:
-                json.dump(
-                    matched_exceptions, f, indent=2, sort_keys=True, ensure_ascii=False
-                )
+                    for message_id in remaining_ids:
+                        print(f"{message_id}: wrong quotes\n{message}")
 
         self.quote_errors = all_errors
-
-    def excludeToken(self, token):
-        """Exclude specific tokens after spellcheck"""
-
-        # Ignore acronyms (all uppercase) and token made up only by
-        # unicode characters, or punctuation
-        if token == token.upper():
-            return True
-
-        # Ignore domains in strings
-        if any(k in token for k in ["example.com", "mozilla.org"]):
-            return True
-
-        # Ignore DevTools accesskeys
-        if any(k in token for k in ["Alt+", "Cmd+", "Ctrl+"]):
-            return True
-
-        return False
+        # Only rewrite the exceptions file (in printOutput) if some
+        # exceptions are no longer needed. Compare as sets: iteration is
+        # grouped by content, so the collection order is not the same as
+        # the order of the file on disk.
+        self.quote_exceptions = (
+            matched_exceptions if set(matched_exceptions) != set(exceptions) else None
+        )
 
     def checkSpelling(self):
         """Check for spelling mistakes"""
@@ -231,160 +493,95 @@ class CheckStrings:
         ) as f:
             exclusions = json.load(f)
             excluded_files = tuple(exclusions["excluded_files"])
-            excluded_strings = exclusions["excluded_strings"]
-
-        punctuation = list(string.punctuation)
-        stop_words = nltk.corpus.stopwords.words("italian")
-
-        placeables = {
-            ".ftl": [
-                # Message references, variables, terms
-                re.compile(
-                    r'(?<!\{)\{\s*([\$|-]?[A-Za-z0-9._-]+)(?:[\[(]?[A-Za-z0-9_\-, :"]+[\])])*\s*\}'
-                ),
-                # DATETIME()
-                re.compile(r"\{\s*DATETIME\(.*\)\s*\}"),
-                # Variants syntax
-                re.compile(r"\{?\s*\$[a-zA-Z]+\s*->"),
-                # Variants names
-                re.compile(r"^\s*\*?\[[a-zA-Z0-9_-]*\]"),
-            ],
-            ".properties": [
-                # printf
-                re.compile(r"(%(?:[0-9]+\$){0,1}(?:[0-9].){0,1}([sS]))"),
-                # webl10n in pdf.js
-                re.compile(
-                    r"\{\[\s?plural\([a-zA-Z]+\)\s?\]\}|\{{1,2}\s?[a-zA-Z_-]+\s?\}{1,2}"
-                ),
-            ],
-            ".dtd": [
-                re.compile(r"&([A-Za-z0-9\.]+);"),
-            ],
-            ".ini": [
-                re.compile(r"%[A-Z_-]+%"),
-            ],
-        }
+            excluded_strings = frozenset(exclusions["excluded_strings"])
 
         all_errors = {}
         total_errors = 0
         misspelled_words = {}
-        ignored_strings = []
-        for message_id, message in self.strings.items():
-            filename, extension = os.path.splitext(message_id.split(":")[0])
-
-            # Ignore excluded files and strings
-            if message_id.split(":")[0].startswith(excluded_files):
-                continue
-            if message_id in excluded_strings:
-                if message_id not in ignored_strings:
-                    ignored_strings.append(message_id)
-                continue
-
-            # Ignore style attributes in fluent messages
-            if extension == ".ftl" and message_id.endswith(".style"):
-                continue
+        ignored_strings = set()
 
+        # First pass: filter out excluded IDs and build the list of unique
+        # (message, extension) combinations to actually spellcheck. The
+        # extension matters because the cleanup step is extension-specific.
+        work = []
+        for message, message_ids in self.content_ids.items():
             # Ignore empty messages
             if not message:
                 continue
             if message == '{""}' or message == '{ "" }':
                 continue
 
-            # Strip HTML
-            cleaned_message = self.strip_tags(message)
-
-            # Remove ellipsis and newlines
-            cleaned_message = cleaned_message.replace("…", "")
-            cleaned_message = cleaned_message.replace(r"\n", " ")
-
-            # Replace other characters to reduce errors
-            cleaned_message = cleaned_message.replace("/", " ")
-            cleaned_message = cleaned_message.replace("=", " = ")
-
-            # Remove placeables from FTL and properties strings
-            if extension in placeables:
-                try:
-                    # Check placeables line by line
-                    lines = cleaned_message.splitlines()
-                    for i in range(len(lines)):
-                        for pattern in placeables[extension]:
-                            lines[i] = pattern.sub(" ", lines[i])
-                    cleaned_message = "\n".join(lines)
-                except Exception as e:
-                    print("Error removing placeables")
-                    print(message_id)
-                    print(e)
-
-            # Tokenize sentence
-            tokens = nltk.word_tokenize(cleaned_message)
-            errors = []
-            for i, token in enumerate(tokens):
-                if message_id in exceptions and token in exceptions[message_id]:
-                    if message_id not in ignored_strings:
-                        ignored_strings.append(message_id)
-                    continue
+            ids_by_extension = {}
+            for message_id in message_ids:
+                filename, extension = os.path.splitext(message_id.split(":")[0])
 
-                """
-                    Clean up tokens. Not doing it before the for cycle, because
-                    I need to be able to access the full sentence with indexes
-                    later on.
-                """
-                if token in punctuation:
+                # Ignore excluded files and strings
+                if message_id.split(":")[0].startswith(excluded_files):
                     continue
-
-                if token.lower() in stop_words:
+                if message_id in excluded_strings:
+                    ignored_strings.add(message_id)
                     continue
 
-                if not self.spellchecker.spell(token):
-                    # It's misspelled, but I still need to remove a few outliers
-                    if self.excludeToken(token):
-                        continue
+                # Ignore style attributes in fluent messages
+                if extension == ".ftl" and message_id.endswith(".style"):
+                    continue
 
-                    """
-                      Check if the next token is an apostrophe. If it is,
-                      check spelling together with the two next tokens.
-                      This allows to ignore things like "cos’altro".
-                    """
-                    if i + 3 <= len(tokens) and tokens[i + 1] == "’":
-                        group = "".join(tokens[i : i + 3])
-                        if self.spellchecker.spell(group):
-                            continue
-
-                    """
-                      It might be a brand with two words, e.g. Common Voice.
-                      Need to look in both direction.
-                    """
-                    if i + 2 <= len(tokens):
-                        group = " ".join(tokens[i : i + 2])
-                        if self.spellchecker.spell(group):
-                            continue
-                    if i >= 1:
-                        group = " ".join(tokens[i - 1 : i + 1])
-                        if self.spellchecker.spell(group):
-                            continue
-
-                    errors.append(token)
-                    if token not in misspelled_words:
-                        misspelled_words[token] = 1
+                ids_by_extension.setdefault(extension, []).append(message_id)
+
+            for extension, extension_ids in ids_by_extension.items():
+                work.append((message, extension, extension_ids))
+
+        # Spellcheck is CPU-bound and independent per message, spread it
+        # over all available cores. Each worker process sets up its own
+        # Hunspell instance and caches, see initSpellingWorker.
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            initializer=initSpellingWorker,
+            initargs=(self.dictionary_path,),
+        ) as executor:
+            results = executor.map(
+                spellcheckMessage,
+                [message for message, _, _ in work],
+                [extension for _, extension, _ in work],
+                chunksize=100,
+            )
+
+            for (message, extension, extension_ids), (
+                cleaned_message,
+                tokens,
+                errors,
+            ) in zip(work, results):
+                # Broadcast the shared result to all string IDs, removing
+                # tokens stored as exceptions for the specific ID.
+                for message_id in extension_ids:
+                    if message_id in exceptions:
+                        exception_tokens = exceptions[message_id]
+                        if any(t in exception_tokens for t in tokens):
+                            ignored_strings.add(message_id)
+                        id_errors = [
+                            t for t in errors if t not in exception_tokens
+                        ]
                     else:
-                        misspelled_words[token] += 1
+                        id_errors = errors
 
-            if errors:
-                total_errors += len(errors)
-                if self.verbose:
-                    print(f"{message_id}: spelling error")
-                    for e in errors:
-                        print(f"Original: {message}")
-                        print(f"Cleaned: {cleaned_message}")
-                        print(f"  {e}")
-                        print(nltk.word_tokenize(message))
-                        print(nltk.word_tokenize(cleaned_message))
-                all_errors[message_id] = errors
+                    if not id_errors:
+                        continue
 
-        with open(
-            os.path.join(self.errors_path, "spelling.json"), "w", encoding="utf8"
-        ) as f:
-            json.dump(all_errors, f, indent=2, sort_keys=True, ensure_ascii=False)
+                    total_errors += len(id_errors)
+                    for token in id_errors:
+                        if token not in misspelled_words:
+                            misspelled_words[token] = 1
+                        else:
+                            misspelled_words[token] += 1
+                    if self.verbose:
+                        print(f"{message_id}: spelling error")
+                        for e in id_errors:
+                            print(f"Original: {message}")
+                            print(f"Cleaned: {cleaned_message}")
+                            print(f"  {e}")
+                            print(nltk.word_tokenize(message))
+                            print(nltk.word_tokenize(cleaned_message))
+                    all_errors[message_id] = id_errors
 
         # Remove things that are not errors from the list of exceptions.
         for message_id in list(exceptions.keys()):
@@ -407,10 +604,6 @@ class CheckStrings:
                 # Assume the tokens in exceptions need to be updated
                 exceptions[message_id] = all_errors[message_id]
 
-        # Write back updated exceptions file
-        with open(exceptions_filename, "w", encoding="utf8") as f:
-            json.dump(exceptions, f, indent=2, sort_keys=True, ensure_ascii=False)
-
         if total_errors:
             print(f"Total number of strings with errors: {len(all_errors)}")
             print(f"Total number of errors: {total_errors}")
@@ -426,16 +619,34 @@ class CheckStrings:
             print("\n".join(above_threshold))
 
         self.spelling_errors = total_errors
+        self.spelling_errors_data = all_errors
+        # Updated exceptions, written back in printOutput
+        self.spelling_exceptions = exceptions
 
     def printOutput(self):
+        """Write output files and print errors"""
+
+        # Batch all file writes here, keeping the checks pure compute
+        with open(os.path.join(self.errors_path, "quotes.json"), "wb") as f:
+            f.write(orjson.dumps(self.quote_errors, option=JSON_OPTIONS))
+        with open(os.path.join(self.errors_path, "spelling.json"), "wb") as f:
+            f.write(orjson.dumps(self.spelling_errors_data, option=JSON_OPTIONS))
+
+        if self.quote_exceptions is not None:
+            with open(os.path.join(self.exceptions_path, "quotes.json"), "wb") as f:
+                f.write(orjson.dumps(self.quote_exceptions, option=JSON_OPTIONS))
+
+        with open(os.path.join(self.exceptions_path, "spelling.json"), "wb") as f:
+            f.write(orjson.dumps(self.spelling_exceptions, option=JSON_OPTIONS))
+
         if self.spelling_errors or self.quote_errors:
-            for type in ["quotes", "spelling"]:
-                filename = os.path.join(self.errors_path, f"{type}.json")
-                with open(filename, "r") as f:
-                    json_data = json.load(f)
-                    if json_data:
-                        print(f"Errors for {type}:")
-                        print(json.dumps(json_data, indent=2))
+            for type, json_data in [
+                ("quotes", self.quote_errors),
+                ("spelling", self.spelling_errors_data),
+            ]:
+                if json_data:
+                    print(f"Errors for {type}:")
+                    print(json.dumps(json_data, indent=2))
             sys.exit(1)
         else:
             print("No errors found.")